@@ -1,29 +1,113 @@
 import tkinter as tk
 import abc
-import uuid
+import itertools
 import random as rnd
 import time
+import math
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+# Items recreated every frame (debug overlays, stats); balls keep persistent items
+FRAME_TAG = 'frame'
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _step_kernel(px, py, vx, vy, r, dt, maxw, maxh):
+        for i in prange(px.shape[0]):
+            px[i] += vx[i] * dt
+            py[i] += vy[i] * dt
+            # Sign flips instead of branches keep the loop body straight-line for the vectorizer
+            vx[i] *= 1 - 2 * ((px[i] + r[i] > maxw) | (px[i] - r[i] < 0))
+            vy[i] *= 1 - 2 * ((py[i] + r[i] > maxh) | (py[i] - r[i] < 0))
+else:
+    _step_kernel = None
+
+
+@functools.lru_cache(maxsize=None)
+def _unrolled_step(count):
+    """Generate a physics step specialised for exactly count balls, with the loop unrolled.
+
+    Without Numba this beats the vectorized NumPy path while there are only a
+    handful of balls and per-call overhead dominates.
+    """
+    lines = ["def step(px, py, vx, vy, r, dt, maxw, maxh):"]
+    for i in range(count):
+        lines.append("    x = px[{0}] = px[{0}] + vx[{0}] * dt".format(i))
+        lines.append("    y = py[{0}] = py[{0}] + vy[{0}] * dt".format(i))
+        lines.append("    if x + r[{0}] > maxw or x - r[{0}] < 0: vx[{0}] = -vx[{0}]".format(i))
+        lines.append("    if y + r[{0}] > maxh or y - r[{0}] < 0: vy[{0}] = -vy[{0}]".format(i))
+    lines.append("    pass")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace['step']
 
 
 def random_color():
     return "#{:06x}".format(rnd.randrange(0, 1<<24))
 
 
+# Balls pick from a pool formatted once at import instead of formatting a fresh color each
+_COLOR_POOL = [random_color() for _ in range(1024)]
+
+
 class IObject:
+    __slots__ = ('uuid', 'game', '_destroyed', '_tick_slot', '_render_slot')
+
+    # Role flags, cheaper to test than isinstance against the ABCMeta interfaces
+    is_renderable = False
+    is_intersectable = False
+    is_clickable = False
+
+    # Ids only need to be unique within the process
+    _next_id = itertools.count()
+
     def __init__(self, game):
-        self.uuid = uuid.uuid4()
+        self.uuid = next(IObject._next_id)
         self.game = game
+        self._destroyed = False
         game.objects[self.uuid] = self
 
+        # Slots remember each object's position in the typed lists for O(1) removal
+        self._tick_slot = self._render_slot = None
+        if type(self).tick is not IObject.tick:
+            self._tick_slot = len(game._tickables)
+            game._tickables.append(self)
+        if self.is_renderable:
+            self._render_slot = len(game._renderables)
+            game._renderables.append(self)
+        if self.is_intersectable and self.is_clickable:
+            game.quadtree.insert(self, self.box)
+
     def tick(self):
         pass
 
+    def detach(self):
+        pass
+
+    def destroy(self):
+        if not self._destroyed:
+            self._destroyed = True
+            self.game._dead.append(self)
+
     @property
     def destroyed(self):
-        return False
+        return self._destroyed
 
 
 class IRenderable(IObject, metaclass=abc.ABCMeta):
+    __slots__ = ()
+    is_renderable = True
+
     @abc.abstractmethod
     def render(self):
         pass
@@ -37,6 +121,8 @@ class NotImplementedError(RuntimeError):
 
 
 class Vector2d:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -70,84 +156,142 @@ class Vector2d:
         return self
 
     def __abs__(self):
-        return abs(complex(self.x, self.y))
+        return math.hypot(self.x, self.y)
 
 
 class IIntersectable(IObject, metaclass=abc.ABCMeta):
+    __slots__ = ()
+    is_intersectable = True
+
     @abc.abstractmethod
     def contains(self, point: Vector2d):
         pass
 
+    @property
+    @abc.abstractmethod
+    def box(self):
+        pass
+
+    def indexed(self, node):
+        pass
+
 
 class IClickable(IObject):
+    __slots__ = ()
+    is_clickable = True
+
     def clicked(self):
         pass
 
 
 class FrameStats(IRenderable):
+    def __init__(self, game):
+        self._shown = None
+        self._item_id = game.canvas.create_text(650, 50, text='', font=("Arial", 20), justify=tk.RIGHT)
+        super().__init__(game)
+
     def render(self):
-        pass
+        if not self.game.debug and self._shown is not None:
+            self._shown = None
+            self.game.canvas.itemconfig(self._item_id, text='')
 
     def render_debug(self):
         duration = self.game.tick_stamp - self.game.last_tick_stamp
-        text = "Tick duration: {0} ms\nFPS: {1}".format(int(1000*duration), int(1.0/duration))
+        shown = (int(1000*duration), int(1.0/duration))
 
-        self.game.next_frame_canvas.create_text(650, 50, text=text, font=("Arial", 20), justify=tk.RIGHT)
+        # Only touch the canvas item when the rounded numbers change
+        if shown != self._shown:
+            self._shown = shown
+            canvas = self.game.canvas
+            canvas.itemconfig(self._item_id, text="Tick duration: {0} ms\nFPS: {1}".format(*shown))
+            canvas.tag_raise(self._item_id)
 
 
 class Ball(IRenderable, IIntersectable, IClickable):
-    def __init__(self, game, position: Vector2d, radius: float):
-        self.position = position
-        self.radius = radius
-        self.color = random_color()
-        self._destroyed = False
+    __slots__ = ('color', '_last_color', '_idx', '_item_id')
 
-        self.velocity = Vector2d(rnd.randrange(-50, 50), rnd.randrange(-50, 50))
-        super().__init__(game)
+    def __init__(self, game, position: Vector2d, radius: float, velocity: Vector2d = None, color: str = None):
+        self.color = color if color is not None else _COLOR_POOL[rnd.randrange(len(_COLOR_POOL))]
 
-    def render(self):
-        self.game.next_frame_canvas.create_oval(self.position.x - self.radius, self.position.y - self.radius,
-                                                self.position.x + self.radius, self.position.y + self.radius,
+        if velocity is None:
+            velocity = Vector2d(rnd.randrange(-50, 50), rnd.randrange(-50, 50))
+        self._item_id = game.canvas.create_oval(position.x - radius, position.y - radius,
+                                                position.x + radius, position.y + radius,
                                                 fill=self.color, width=0)
+        self._last_color = self.color
+        self._idx = game.physics.add(self, position, velocity, radius, self._item_id)
+        super().__init__(game)
 
-    def render_debug(self):
-        self.game.next_frame_canvas.create_oval(self.position.x - 2, self.position.y - 2,
-                                                self.position.x + 2, self.position.y + 2,
-                                                fill='black', width=0)
-        self.game.next_frame_canvas.create_text(self.position.x, self.position.y + 15,
-                                                text=str(self.uuid).split('-')[0], fill='black')
+    @property
+    def position(self):
+        physics = self.game.physics
+        return Vector2d(physics.px[self._idx], physics.py[self._idx])
 
-        vel_base = self.position + self.velocity * self.radius * (1 / abs(self.velocity))
-        self.game.next_frame_canvas.create_line(vel_base.x, vel_base.y,
-                                                vel_base.x + self.velocity.x, vel_base.y + self.velocity.y,
-                                                width='3')
+    @position.setter
+    def position(self, value: Vector2d):
+        physics = self.game.physics
+        physics.px[self._idx] = value.x
+        physics.py[self._idx] = value.y
 
-    def contains(self, point: Vector2d):
-        return self.radius > abs(complex(self.position.x - point.x, self.position.y - point.y))
+    @property
+    def velocity(self):
+        physics = self.game.physics
+        return Vector2d(physics.vx[self._idx], physics.vy[self._idx])
+
+    @velocity.setter
+    def velocity(self, value: Vector2d):
+        physics = self.game.physics
+        physics.vx[self._idx] = value.x
+        physics.vy[self._idx] = value.y
 
     @property
-    def destroyed(self):
-        return self._destroyed
+    def radius(self):
+        return self.game.physics.r[self._idx]
 
-    def tick(self):
-        self.position += self.velocity * 0.02
+    @property
+    def box(self):
+        physics, i = self.game.physics, self._idx
+        x, y, r = float(physics.px[i]), float(physics.py[i]), float(physics.r[i])
+        return x - r, y - r, x + r, y + r
+
+    def indexed(self, node):
+        physics, i = self.game.physics, self._idx
+        physics.cell_x0[i], physics.cell_y0[i], physics.cell_x1[i], physics.cell_y1[i] = node.cell
+        physics.split_x[i], physics.split_y[i] = node.split_point
+
+    def render(self):
+        # Ball items are moved together by Game.render_balls in a single Tcl call;
+        # here the fill is only pushed to the item when the color has changed
+        if self.color != self._last_color:
+            self._last_color = self.color
+            self.game.canvas.itemconfig(self._item_id, fill=self.color)
+
+    def render_debug(self):
+        physics, i = self.game.physics, self._idx
+        x, y, vx, vy, r = physics.px[i], physics.py[i], physics.vx[i], physics.vy[i], physics.r[i]
+        view_w, view_h = self.game.view_size
+        if x + r < 0 or x - r > view_w or y + r < 0 or y - r > view_h:
+            return
 
-        if self.position.x + self.radius > self.game.maxw:
-            self.velocity.x *= -1
+        self.game.canvas.create_oval(x - 2, y - 2, x + 2, y + 2, fill='black', width=0, tags=FRAME_TAG)
+        self.game.canvas.create_text(x, y + 15, text=str(self.uuid), fill='black', tags=FRAME_TAG)
 
-        if self.position.y + self.radius > self.game.maxh:
-            self.velocity.y *= -1
+        scale = r / math.hypot(vx, vy)
+        base_x, base_y = x + vx * scale, y + vy * scale
+        self.game.canvas.create_line(base_x, base_y, base_x + vx, base_y + vy, width='3', tags=FRAME_TAG)
 
-        if self.position.x - self.radius < 0:
-            self.velocity.x *= -1
+    def contains(self, point: Vector2d):
+        physics, i = self.game.physics, self._idx
+        dx, dy, r = float(physics.px[i]) - point.x, float(physics.py[i]) - point.y, float(physics.r[i])
+        return dx * dx + dy * dy < r * r
 
-        if self.position.y - self.radius < 0:
-            self.velocity.y *= -1
+    def detach(self):
+        self.game.physics.remove(self)
+        self.game.canvas.delete(self._item_id)
 
     def clicked(self):
         print("Clicked ball {0}".format(str(self.uuid)))
-        self.position.x = rnd.randrange(100, 700)
-        self.position.y = rnd.randrange(100, 600)
+        self.position = Vector2d(rnd.randrange(100, 700), rnd.randrange(100, 600))
         self.velocity = Vector2d(rnd.randrange(-50, 50), rnd.randrange(-50, 50))
 
 
@@ -156,90 +300,380 @@ class BallFactory:
         self.game = game
 
     def create_random_ball(self):
-        radius = rnd.randrange(10, 50)
-        position = Vector2d(rnd.randrange(100, 700), rnd.randrange(100, 500))
-        ball = Ball(self.game, position, radius)
-        self.game.objects[ball.uuid] = ball
-        return ball
+        return self.create_random_balls(1)[0]
+
+    def create_random_balls(self, count):
+        # One draw for every parameter of every ball: radius, x, y, vx, vy, color
+        params = self.game.rng.integers((10, 100, 100, -50, -50, 0), (50, 700, 500, 50, 50, len(_COLOR_POOL)),
+                                        size=(count, 6)).tolist()
+
+        balls = []
+        for radius, x, y, vx, vy, color in params:
+            ball = Ball(self.game, Vector2d(x, y), radius, Vector2d(vx, vy), _COLOR_POOL[color])
+            self.game.objects[ball.uuid] = ball
+            balls.append(ball)
+        return balls
+
+
+class BallPhysics:
+    """Ball state stored as a structure of arrays, one float32 row per field.
+
+    Balls keep only their column index, so a physics step is a handful of
+    vectorized operations regardless of how many balls there are. The drawn_x
+    and drawn_y rows hold the position each ball's canvas item was last moved to,
+    and the cell and split rows the bounds and split point of the quadtree node
+    the ball is filed under. Canvas item ids live in a separate integer array.
+
+    generation changes whenever balls are added or removed, which tells a
+    snapshot whether its indices still refer to the same balls.
+    """
+
+    # Up to this many balls the unrolled step is faster than the NumPy one
+    UNROLL_LIMIT = 8
+
+    def __init__(self, capacity=16):
+        self.balls = []
+        self.generation = 0
+        self._data = np.zeros((13, capacity), dtype=np.float32)
+        self.items = np.zeros(capacity, dtype=np.int64)
+        self._bind()
+
+    def _bind(self):
+        (self.px, self.py, self.vx, self.vy, self.r, self.drawn_x, self.drawn_y,
+         self.cell_x0, self.cell_y0, self.cell_x1, self.cell_y1, self.split_x, self.split_y) = self._data
+
+    def __len__(self):
+        return len(self.balls)
+
+    def add(self, ball, position: Vector2d, velocity: Vector2d, radius: float, item_id: int):
+        index = len(self.balls)
+        if index == self._data.shape[1]:
+            grown = np.zeros((self._data.shape[0], 2 * index), dtype=self._data.dtype)
+            grown[:, :index] = self._data
+            self._data = grown
+            self.items = np.concatenate((self.items, np.zeros(index, dtype=self.items.dtype)))
+            self._bind()
+
+        self._data[:, index] = (position.x, position.y, velocity.x, velocity.y, radius, position.x, position.y,
+                                -np.inf, -np.inf, np.inf, np.inf, np.nan, np.nan)
+        self.items[index] = item_id
+        self.balls.append(ball)
+        self.generation += 1
+        return index
+
+    def remove(self, ball):
+        # Move the last ball into the freed column so the arrays stay dense
+        index, last = ball._idx, len(self.balls) - 1
+        moved = self.balls.pop()
+        if index != last:
+            self._data[:, index] = self._data[:, last]
+            self.items[index] = self.items[last]
+            self.balls[index] = moved
+            moved._idx = index
+        self.generation += 1
+
+    def snapshot(self):
+        """Copy of what ball_moves needs, safe to hand to another thread."""
+        n = len(self.balls)
+        # Fancy indexing already returns a copy of the rows
+        return self.generation, self._data[[0, 1, 4, 5, 6], :n], self.items[:n].copy()
+
+    def step(self, dt, maxw, maxh):
+        n = len(self.balls)
+        px, py, vx, vy, r = self.px[:n], self.py[:n], self.vx[:n], self.vy[:n], self.r[:n]
+
+        if _step_kernel is not None:
+            _step_kernel(px, py, vx, vy, r, float(dt), float(maxw), float(maxh))
+            return
+
+        if n <= self.UNROLL_LIMIT:
+            _unrolled_step(n)(px, py, vx, vy, r, dt, maxw, maxh)
+            return
+
+        px += vx * dt
+        py += vy * dt
+
+        flip_x = ((px + r > maxw) | (px - r < 0)).astype(np.float32)
+        flip_y = ((py + r > maxh) | (py - r < 0)).astype(np.float32)
+        vx -= 2 * flip_x * vx
+        vy -= 2 * flip_y * vy
+
+    def misfiled(self):
+        """Indices of balls that left their quadtree cell or now fit into one of its children."""
+        n = len(self.balls)
+        px, py, r = self.px[:n], self.py[:n], self.r[:n]
+        x0, y0, x1, y1 = px - r, py - r, px + r, py + r
+        split_x, split_y = self.split_x[:n], self.split_y[:n]
+
+        # Comparisons against the NaN split point of a leaf are always false
+        escaped = ((x0 < self.cell_x0[:n]) | (y0 < self.cell_y0[:n]) |
+                   (x1 > self.cell_x1[:n]) | (y1 > self.cell_y1[:n]))
+        descends = ((x1 <= split_x) | (x0 >= split_x)) & ((y1 <= split_y) | (y0 >= split_y))
+        return np.flatnonzero(escaped | descends)
+
+
+def ball_moves(snapshot, view_w, view_h):
+    """Work out which ball items moved by at least a pixel since they were last drawn.
+
+    Balls that are off the view both where they were drawn and where they are
+    now are left alone. Returns the snapshot generation, the moved indices,
+    their new positions and the flat (id, x1, y1, x2, y2, ...) argument list
+    for the moveballs Tcl proc.
+    """
+    generation, (px, py, r, drawn_x, drawn_y), items = snapshot
+    visible = (px + r >= 0) & (px - r <= view_w) & (py + r >= 0) & (py - r <= view_h)
+    was_visible = (drawn_x + r >= 0) & (drawn_x - r <= view_w) & (drawn_y + r >= 0) & (drawn_y - r <= view_h)
+    moved = np.flatnonzero(((np.abs(px - drawn_x) >= 1) | (np.abs(py - drawn_y) >= 1)) & (visible | was_visible))
+
+    x, y, r = px[moved], py[moved], r[moved]
+    boxes = np.stack((x - r, y - r, x + r, y + r), axis=1).tolist()
+
+    args = []
+    for item_id, box in zip(items[moved].tolist(), boxes):
+        args.append(item_id)
+        args.extend(box)
+    return generation, moved, x, y, args
+
+
+class QuadNode:
+    __slots__ = ('bounds', 'cell', 'split_point', 'depth', 'items', 'children')
+
+    def __init__(self, bounds, depth):
+        self.bounds = bounds
+        self.cell = bounds
+        self.split_point = (math.nan, math.nan)
+        self.depth = depth
+        self.items = set()
+        self.children = None
+
+    def split(self):
+        x0, y0, x1, y1 = self.bounds
+        mx, my = (x0 + x1) / 2, (y0 + y1) / 2
+        self.split_point = (mx, my)
+        self.children = [QuadNode(bounds, self.depth + 1)
+                         for bounds in ((x0, y0, mx, my), (mx, y0, x1, my), (x0, my, mx, y1), (mx, my, x1, y1))]
+
+    def child_containing(self, box):
+        if self.children is None:
+            return None
+        for child in self.children:
+            x0, y0, x1, y1 = child.bounds
+            if x0 <= box[0] and y0 <= box[1] and box[2] <= x1 and box[3] <= y1:
+                return child
+        return None
+
+    def child_at(self, x, y):
+        if self.children is None:
+            return None
+        x0, y0, x1, y1 = self.bounds
+        return self.children[(x >= (x0 + x1) / 2) + 2 * (y >= (y0 + y1) / 2)]
+
+
+class QuadTree:
+    """Region quadtree over boxes given as (x0, y0, x1, y1).
+
+    Every item is filed under the deepest node whose bounds fully contain its
+    box, so a point query only visits the nodes along one root-to-leaf path.
+    The root also takes anything that sticks out of the tree bounds. Items are
+    told their node through IIntersectable.indexed whenever it changes, and
+    nodes read an item's current box when they split.
+    """
+
+    def __init__(self, bounds, threshold=8, max_depth=8):
+        self.root = QuadNode(bounds, 0)
+        self.root.cell = (-math.inf, -math.inf, math.inf, math.inf)
+        self.threshold = threshold
+        self.max_depth = max_depth
+        self._nodes = {}
+
+    def _place(self, item, node):
+        node.items.add(item)
+        self._nodes[item] = node
+        item.indexed(node)
+
+    def insert(self, item, box):
+        node = self.root
+        child = node.child_containing(box)
+        while child is not None:
+            node = child
+            child = node.child_containing(box)
+        self._place(item, node)
+
+        if node.children is None and len(node.items) > self.threshold and node.depth < self.max_depth:
+            node.split()
+            for other in list(node.items):
+                # Items move without being re-filed, so only their current box is reliable
+                child = node.child_containing(other.box)
+                if child is not None:
+                    node.items.discard(other)
+                    self._place(other, child)
+                else:
+                    other.indexed(node)
+
+    def remove(self, item):
+        node = self._nodes.pop(item, None)
+        if node is not None:
+            node.items.discard(item)
+
+    def update(self, item, box):
+        self.remove(item)
+        self.insert(item, box)
+
+    def query_point(self, x, y):
+        node = self.root
+        while node is not None:
+            yield from node.items
+            node = node.child_at(x, y)
 
 
 class Game:
+    # Physics advances in fixed steps of PHYSICS_DT simulated seconds, one per
+    # PHYSICS_INTERVAL_MS of wall time; rendering runs on its own schedule
+    PHYSICS_INTERVAL_MS = 10
+    PHYSICS_DT = 0.02
+    MAX_PHYSICS_STEPS = 5
+    RENDER_INTERVAL_MS = 16
+
     def __init__(self, debug=False):
         self.root = tk.Tk()
         self.root.geometry('800x600')
 
-        self._frames = [tk.Canvas(self.root, bg='white')]
-        self._frame_index = 0
+        self.canvas = tk.Canvas(self.root, bg='white')
+        self.canvas.pack(fill=tk.BOTH, expand=1)
+        self.canvas.bind('<Configure>', self.resized)
 
-        self.frame_canvas.pack(fill=tk.BOTH, expand=1)
+        self.root.tk.eval('proc moveballs {c args} {'
+                          ' foreach {id x1 y1 x2 y2} $args {'
+                          ' $c coords $id $x1 $y1 $x2 $y2 } }')
 
         self.objects = {}
+        self.physics = BallPhysics()
+        self._tickables = []
+        self._renderables = []
+        self._dead = []
 
         self.debug = debug
         self.pause = False
 
         self.maxh, self.maxw = 600, 800
+        self.view_size = (self.maxw, self.maxh)
+        self.rng = np.random.default_rng()
+        self.quadtree = QuadTree((0, 0, self.maxw, self.maxh))
 
-        self.last_tick_stamp = time.time()
-        self.tick_stamp = time.time()
-
-        ctr = FrameStats(self)
-        self.objects[ctr.uuid] = ctr
-
-    def sanitize_frame_index(self, index=None):
-        if index is None:
-            index = self._frame_index
-        return index % len(self._frames)
-
-    @property
-    def frame_canvas(self):
-        return self._frames[self._frame_index]
-
-    @property
-    def next_frame_canvas(self):
-        return self._frames[self.sanitize_frame_index(self._frame_index)]
-
-    def switch_frame(self):
-        # self.frame_canvas.pack_forget()
-        self.frame_canvas.delete(tk.ALL)
-        self._frame_index += 1
-        self._frame_index = self.sanitize_frame_index()
-        # self.frame_canvas.pack(fill=tk.BOTH, expand=1)
+        self.last_tick_stamp = time.perf_counter()
+        self.tick_stamp = time.perf_counter()
 
-    def tick(self):
-        self.switch_frame()
+        self._physics_stamp = time.perf_counter()
+        self._accumulator = 0.0
 
-        self.tick_stamp = time.time()
+        # Draw arguments are computed off the main thread; Tk calls stay on it
+        self._render_pool = ThreadPoolExecutor(1)
+        self._pending_moves = None
 
-        if not self.pause:
-            for key in self.objects:
-                self.objects[key].tick()
+        # Bound once so rescheduling doesn't look them up or rebind every tick
+        self._after = self.root.after
+        self._physics_tick_cb = self._physics_tick
+        self._render_tick_cb = self._render_tick
 
-        dead = []
-        for key in self.objects:
-            if self.objects[key].destroyed:
-                dead.append(key)
-
-        for key in dead:
-            del self.objects[key]
+        ctr = FrameStats(self)
+        self.objects[ctr.uuid] = ctr
 
-        for key in self.objects:
-            obj = self.objects[key]
-            if isinstance(obj, IRenderable):
+    def _physics_tick(self):
+        now = time.perf_counter()
+        self._accumulator += now - self._physics_stamp
+        self._physics_stamp = now
+
+        physics, tickables = self.physics, self._tickables
+        interval = self.PHYSICS_INTERVAL_MS / 1000
+        steps = 0
+        while self._accumulator >= interval:
+            if steps == self.MAX_PHYSICS_STEPS:
+                # Too far behind to catch up; drop the backlog instead of spiralling
+                self._accumulator = 0.0
+                break
+
+            if not self.pause:
+                physics.step(self.PHYSICS_DT, self.maxw, self.maxh)
+                for obj in tickables:
+                    obj.tick()
+            self._accumulator -= interval
+            steps += 1
+
+        balls, update = physics.balls, self.quadtree.update
+        for index in physics.misfiled().tolist():
+            update(balls[index], balls[index].box)
+
+        if self._dead:
+            dead, self._dead = self._dead, []
+            for obj in dead:
+                self.remove(obj)
+
+        self._after(self.PHYSICS_INTERVAL_MS, self._physics_tick_cb)
+
+    def _render_tick(self):
+        self.canvas.delete(FRAME_TAG)
+
+        self.tick_stamp = time.perf_counter()
+
+        self.render_balls()
+        if self.debug:
+            for obj in self._renderables:
+                obj.render()
+                obj.render_debug()
+        else:
+            for obj in self._renderables:
                 obj.render()
-                if self.debug:
-                    obj.render_debug()
 
         self.last_tick_stamp = self.tick_stamp
-        self.root.after(10, self.tick)
+        self._after(self.RENDER_INTERVAL_MS, self._render_tick_cb)
+
+    def render_balls(self):
+        # Flush the moves computed from the previous frame's snapshot while the
+        # worker computes the next ones, so balls are drawn one frame behind
+        physics = self.physics
+        if self._pending_moves is not None:
+            generation, moved, x, y, args = self._pending_moves.result()
+            if generation == physics.generation:
+                physics.drawn_x[moved] = x
+                physics.drawn_y[moved] = y
+            if args:
+                self.root.tk.call('moveballs', str(self.canvas), *args)
+
+        self._pending_moves = self._render_pool.submit(ball_moves, physics.snapshot(), *self.view_size)
+
+    @staticmethod
+    def _discard(items, index):
+        # Swap the last element into the freed slot instead of shifting the tail;
+        # returns the element that moved, if any
+        last = items.pop()
+        if index < len(items):
+            items[index] = last
+            return last
+        return None
+
+    def remove(self, obj):
+        del self.objects[obj.uuid]
+        obj.detach()
+        if obj._tick_slot is not None:
+            moved = self._discard(self._tickables, obj._tick_slot)
+            if moved is not None:
+                moved._tick_slot = obj._tick_slot
+        if obj._render_slot is not None:
+            moved = self._discard(self._renderables, obj._render_slot)
+            if moved is not None:
+                moved._render_slot = obj._render_slot
+        if obj.is_intersectable and obj.is_clickable:
+            self.quadtree.remove(obj)
 
     def clicked(self, event):
         point = Vector2d(event.x, event.y)
-        for key in self.objects:
-            obj = self.objects[key]
-            if isinstance(obj, IIntersectable) and isinstance(obj, IClickable) and obj.contains(point):
+        for obj in list(self.quadtree.query_point(event.x, event.y)):
+            if obj.contains(point):
                 obj.clicked()
 
+    def resized(self, event):
+        self.view_size = (event.width, event.height)
+
     def toggle_pause(self, *args):
         self.pause = not self.pause
 
@@ -248,13 +682,14 @@ class Game:
 
     def run(self):
         factory = BallFactory(self)
-        for i in range(5):
-            factory.create_random_ball()
+        factory.create_random_balls(5)
 
         self.root.bind('<Button-1>', self.clicked)
         self.root.bind('<space>', self.toggle_pause)
         self.root.bind('<d>', self.toggle_debug)
-        self.root.after(10, self.tick)
+        self._physics_stamp = time.perf_counter()
+        self._after(self.PHYSICS_INTERVAL_MS, self._physics_tick_cb)
+        self._after(self.RENDER_INTERVAL_MS, self._render_tick_cb)
         self.root.mainloop()
 
 
@@ -0,0 +1,31 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from main import QuadTree
+
+
+class Item:
+    def __init__(self, box):
+        self.box = box
+        self.node = None
+
+    def indexed(self, node):
+        self.node = node
+
+
+def test_split_files_items_by_current_box():
+    tree = QuadTree((0, 0, 800, 600), threshold=2)
+
+    # Filed while in the right half, then moved across the split line without re-filing
+    moved = Item((640.5, 100.4, 678.5, 138.4))
+    tree.insert(moved, moved.box)
+    moved.box = (300.4, 100.4, 338.4, 138.4)
+
+    for box in ((10, 10, 20, 20), (30, 30, 40, 40)):
+        other = Item(box)
+        tree.insert(other, other.box)
+
+    assert moved in tree.query_point(320, 120)
+    assert moved.node.bounds == (0, 0, 400, 300)